@@ -7,6 +7,7 @@ from isshub.domain.utils.entity import (
     BaseEntityWithIdentifier,
     field_validator,
     optional_field,
+    optional_self_field,
     required_field,
     validated,
 )
@@ -41,8 +42,8 @@ class Namespace(BaseEntityWithIdentifier):
 
     name: str = required_field(str)
     kind: NamespaceKind = required_field(NamespaceKind, relation_verbose_name="is a")
-    namespace: Optional["Namespace"] = optional_field(
-        "self", relation_verbose_name="may belongs to"
+    namespace: Optional["Namespace"] = optional_self_field(
+        relation_verbose_name="may belongs to"
     )
     description: Optional[str] = optional_field(str)
 
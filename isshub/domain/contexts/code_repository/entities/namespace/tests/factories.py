@@ -1,8 +1,8 @@
 """Module defining factories for the Namespace code_repository entity."""
 
-import factory
+from uuid import uuid4
 
-from faker_enum import EnumProvider
+import factory
 
 from isshub.domain.contexts.code_repository.entities.namespace import (
     Namespace,
@@ -10,9 +10,6 @@ from isshub.domain.contexts.code_repository.entities.namespace import (
 )
 
 
-factory.Faker.add_provider(EnumProvider)
-
-
 class NamespaceFactory(factory.Factory):
     """Factory for the ``Namespace`` code_repository entity."""
 
@@ -21,6 +18,6 @@ class NamespaceFactory(factory.Factory):
 
         model = Namespace
 
-    identifier = factory.Faker("uuid4", cast_to=None)
-    name = factory.Faker("pystr", min_chars=2)
-    kind = factory.Faker("enum", enum_cls=NamespaceKind)
+    identifier = factory.LazyFunction(uuid4)
+    name = factory.Sequence(lambda n: f"name{n:02d}")
+    kind = factory.Iterator(NamespaceKind)
@@ -6,14 +6,17 @@ from typing import Type
 from pytest import fixture
 
 from isshub.domain.contexts.code_repository.entities.namespace import Namespace
+from isshub.domain.utils.entity import validation_disabled
 
 from .factories import NamespaceFactory
 
 
-@fixture  # type: ignore
+@fixture(scope="session")  # type: ignore
 def namespace_factory() -> Type[NamespaceFactory]:
     """Fixture to return the factory to create a ``Namespace``.
 
+    The factory class holds no per-test state, so it is shared by the whole test session.
+
     Returns
     -------
     Type[NamespaceFactory]
@@ -27,10 +30,30 @@ def namespace_factory() -> Type[NamespaceFactory]:
 def namespace() -> Namespace:
     """Fixture to return a ``Namespace``.
 
+    The namespace is created without being validated (the factory creates valid namespaces), it's
+    up to the test to validate it if needed.
+
+    Returns
+    -------
+    Namespace
+        The created ``Namespace``
+
+    """
+    with validation_disabled():
+        return NamespaceFactory()
+
+
+@fixture(scope="session")  # type: ignore
+def namespace_default() -> Namespace:
+    """Fixture to return a ``Namespace`` shared by the whole test session.
+
+    It must not be updated, so it's only for tests reading it. Use ``namespace`` for other ones.
+
     Returns
     -------
     Namespace
         The created ``Namespace``
 
     """
-    return NamespaceFactory()
+    with validation_disabled():
+        return NamespaceFactory()
@@ -1,12 +1,23 @@
-"""Module holding BDD tests for isshub Namespace code_repository entity as defined in ``describe.feature``."""
+"""Module holding BDD tests for isshub Namespace code_repository entity as defined in ``describe.feature``.
+
+PYTEST_DONT_REWRITE: there are no ``assert`` in this module, they are in the validation helpers,
+so there is no need for pytest to rewrite it.
+"""
 from functools import partial
 from uuid import uuid4
 
 import pytest
 from pytest import mark
-from pytest_bdd import given, parsers, scenario, scenarios, then
+from pytest_bdd import given, scenario, scenarios, then
 
 from isshub.domain.contexts.code_repository.entities.namespace import NamespaceKind
+from isshub.domain.utils.entity import validation_disabled
+from isshub.domain.utils.testing.bdd_parsers import (
+    FIELD_MANDATORY,
+    FIELD_NAMED,
+    FIELD_OPTIONAL,
+    FIELD_TYPE,
+)
 from isshub.domain.utils.testing.validation import (
     FrozenAttributeError,
     check_field,
@@ -17,12 +28,15 @@ from isshub.domain.utils.testing.validation import (
     uuid4_only,
 )
 
-from .fixtures import namespace, namespace_factory
+from .fixtures import namespace, namespace_default, namespace_factory
 
 
 FEATURE_FILE = "../features/describe.feature"
 scenario = partial(scenario, FEATURE_FILE)
 
+# Value to use in parametrize rows to be replaced by a new namespace in the step
+NEW_NAMESPACE = object()
+
 
 @mark.parametrize(["value", "exception"], uuid4_only)
 @scenario("A namespace identifier is a uuid")
@@ -38,7 +52,7 @@ def test_namespace_name_is_a_string(value, exception):
 
 @mark.parametrize(
     ["value", "exception"],
-    [(pytest.lazy_fixture("namespace"), None), ("foo", TypeError), (1, TypeError)],
+    [(NEW_NAMESPACE, None), ("foo", TypeError), (1, TypeError)],
 )
 @scenario("A namespace namespace is a namespace")
 def test_namespace_namespace_is_a_namespace(value, exception):
@@ -60,17 +74,18 @@ def test_namespace_description_is_a_string(value, exception):
     pass
 
 
-@given("a namespace", target_fixture="namespace")
-def a_namespace(namespace_factory):
-    return namespace_factory()
+@given("a namespace")
+def a_namespace():
+    # created on demand by the `namespace` or `namespace_default` fixtures, if used
+    pass
 
 
-@then(parsers.parse("it must have a field named {field_name:w}"))
-def namespace_has_field(namespace, field_name):
-    check_field(namespace, field_name)
+@then(FIELD_NAMED)
+def namespace_has_field(namespace_default, field_name):
+    check_field(namespace_default, field_name)
 
 
-@then(parsers.parse("its {field_name:w} must be a {field_type}"))
+@then(FIELD_TYPE)
 def namespace_field_is_of_a_certain_type(
     namespace_factory,
     field_name,
@@ -79,22 +94,19 @@ def namespace_field_is_of_a_certain_type(
     value,
     exception,
 ):
+    if value is NEW_NAMESPACE:
+        value = namespace_factory()
     check_field_value(namespace_factory, field_name, value, exception)
 
 
-@then(parsers.parse("its {field_name:w} is mandatory"))
-def namespace_field_is_mandatory(namespace_factory, field_name):
-    check_field_not_nullable(namespace_factory, field_name)
+@then(FIELD_MANDATORY)
+def namespace_field_is_mandatory(namespace_factory, namespace, field_name):
+    check_field_not_nullable(namespace_factory, field_name, instance=namespace)
 
 
-@then(parsers.parse("its {field_name:w} is optional"))
-def namespace_field_is_optional(namespace_factory, field_name):
-    check_field_nullable(namespace_factory, field_name)
-
-
-@scenario("A namespace identifier cannot be changed")
-def test_namespace_identifier_cannot_be_changed():
-    pass
+@then(FIELD_OPTIONAL)
+def namespace_field_is_optional(namespace_factory, namespace, field_name):
+    check_field_nullable(namespace_factory, field_name, instance=namespace)
 
 
 @then("its identifier cannot be changed")
@@ -103,11 +115,6 @@ def namespace_identifier_cannot_be_changed(namespace):
         namespace.identifier = uuid4()
 
 
-@scenario("A namespace cannot be contained in itself")
-def test_namespace_namespace_cannot_be_itself():
-    pass
-
-
 @then("its namespace cannot be itself")
 def namespace_namespace_cannot_be_itself(namespace):
     namespace.namespace = namespace
@@ -115,19 +122,17 @@ def namespace_namespace_cannot_be_itself(namespace):
         namespace.validate()
 
 
-@scenario("A namespace namespace cannot be in a loop")
-def test_namespace_namespace_cannot_be_in_a_loop():
-    pass
-
-
 @given("a second namespace", target_fixture="namespace2")
 def a_second_namespace(namespace_factory):
-    return namespace_factory()
+    # validated only when needed by the scenario
+    with validation_disabled():
+        return namespace_factory()
 
 
 @given("a third namespace", target_fixture="namespace3")
 def a_third_namespace(namespace_factory):
-    return namespace_factory()
+    with validation_disabled():
+        return namespace_factory()
 
 
 @then("we cannot create a relationships loop with these namespaces")
@@ -153,5 +158,6 @@ def namespace_relationships_cannot_create_a_loop(namespace, namespace2, namespac
     namespace.validate()
 
 
-# To make pytest-bdd fail if some scenarios are not implemented. KEEP AT THE END
+# To make pytest-bdd fail if some scenarios are not implemented, and to bind the ones not needing
+# parametrization. KEEP AT THE END
 scenarios(FEATURE_FILE)
@@ -1,5 +1,7 @@
 """Module defining factories for the Repository code_repository entity."""
 
+from uuid import uuid4
+
 import factory
 
 from isshub.domain.contexts.code_repository.entities.repository import Repository
@@ -15,6 +17,6 @@ class RepositoryFactory(factory.Factory):
 
         model = Repository
 
-    identifier = factory.Faker("uuid4", cast_to=None)
-    name = factory.Faker("pystr", min_chars=2)
+    identifier = factory.LazyFunction(uuid4)
+    name = factory.Sequence(lambda n: f"name{n:02d}")
     namespace = factory.SubFactory(NamespaceFactory)
@@ -3,13 +3,17 @@
 
 from pytest import fixture
 
+from isshub.domain.utils.entity import validation_disabled
+
 from .factories import RepositoryFactory
 
 
-@fixture
+@fixture(scope="session")
 def repository_factory():
     """Fixture to return the factory to create a ``Repository``.
 
+    The factory class holds no per-test state, so it is shared by the whole test session.
+
     Returns
     -------
     Type[RepositoryFactory]
@@ -17,3 +21,36 @@ def repository_factory():
 
     """
     return RepositoryFactory
+
+
+@fixture
+def repository():
+    """Fixture to return a ``Repository``.
+
+    The repository is created without being validated (the factory creates valid repositories),
+    it's up to the test to validate it if needed.
+
+    Returns
+    -------
+    Repository
+        The created ``Repository``
+
+    """
+    with validation_disabled():
+        return RepositoryFactory()
+
+
+@fixture(scope="session")
+def repository_default():
+    """Fixture to return a ``Repository`` shared by the whole test session.
+
+    It must not be updated, so it's only for tests reading it. Use ``repository`` for other ones.
+
+    Returns
+    -------
+    Repository
+        The created ``Repository``
+
+    """
+    with validation_disabled():
+        return RepositoryFactory()
@@ -1,11 +1,20 @@
-"""Module holding BDD tests for isshub Repository code_repository entity."""
+"""Module holding BDD tests for isshub Repository code_repository entity.
+
+PYTEST_DONT_REWRITE: there are no ``assert`` in this module, they are in the validation helpers,
+so there is no need for pytest to rewrite it.
+"""
 from functools import partial
 from uuid import uuid4
 
 import pytest
 from pytest import mark
-from pytest_bdd import given, parsers, scenario, scenarios, then
+from pytest_bdd import given, scenario, scenarios, then
 
+from isshub.domain.utils.testing.bdd_parsers import (
+    FIELD_MANDATORY,
+    FIELD_NAMED,
+    FIELD_TYPE,
+)
 from isshub.domain.utils.testing.validation import (
     FrozenAttributeError,
     check_field,
@@ -15,13 +24,16 @@ from isshub.domain.utils.testing.validation import (
     uuid4_only,
 )
 
-from ...namespace.tests.fixtures import namespace
-from .fixtures import repository_factory
+from ...namespace.tests.fixtures import namespace_default
+from .fixtures import repository, repository_default, repository_factory
 
 
 FEATURE_FILE = "../features/describe.feature"
 scenario = partial(scenario, FEATURE_FILE)
 
+# Value to use in parametrize rows to be replaced by a namespace in the step
+A_NAMESPACE = object()
+
 
 @mark.parametrize(["value", "exception"], uuid4_only)
 @scenario("A repository identifier is a uuid")
@@ -37,43 +49,52 @@ def test_repository_name_is_a_string(value, exception):
 
 @mark.parametrize(
     ["value", "exception"],
-    [(pytest.lazy_fixture("namespace"), None), ("foo", TypeError), (1, TypeError)],
+    [(A_NAMESPACE, None), ("foo", TypeError), (1, TypeError)],
 )
 @scenario("A repository namespace is a Namespace")
 def test_repository_namespace_is_a_namespace(value, exception):
     pass
 
 
-@given("a repository", target_fixture="repository")
-def a_repository(repository_factory):
-    return repository_factory()
+@given("a repository")
+def a_repository():
+    # created on demand by the `repository` or `repository_default` fixtures, if used
+    pass
 
 
-@then(parsers.parse("it must have a field named {field_name:w}"))
-def repository_has_field(repository, field_name):
-    check_field(repository, field_name)
+@then(FIELD_NAMED)
+def repository_has_field(repository_default, field_name):
+    check_field(repository_default, field_name)
 
 
-@then(parsers.parse("its {field_name:w} must be a {field_type}"))
+@then(FIELD_TYPE)
 def repository_field_is_of_a_certain_type(
     repository_factory,
+    namespace_default,
     field_name,
     field_type,
     # next args are for parametrize
     value,
     exception,
 ):
-    check_field_value(repository_factory, field_name, value, exception)
+    if value is A_NAMESPACE:
+        value = namespace_default
+    # the same namespace is used for all the repositories, instead of creating a new one for each
+    check_field_value(
+        repository_factory, field_name, value, exception, namespace=namespace_default
+    )
 
 
-@then(parsers.parse("its {field_name:w} is mandatory"))
-def repository_field_is_mandatory(repository_factory, field_name):
-    check_field_not_nullable(repository_factory, field_name)
-
-
-@scenario("A repository identifier cannot be changed")
-def test_repository_identifier_cannot_be_changed():
-    pass
+@then(FIELD_MANDATORY)
+def repository_field_is_mandatory(
+    repository_factory, repository, namespace_default, field_name
+):
+    check_field_not_nullable(
+        repository_factory,
+        field_name,
+        instance=repository,
+        namespace=namespace_default,
+    )
 
 
 @then("its identifier cannot be changed")
@@ -82,5 +103,6 @@ def repository_identifier_cannot_be_changed(repository):
         repository.identifier = uuid4()
 
 
-# To make pytest-bdd fail if some scenarios are not implemented. KEEP AT THE END
+# To make pytest-bdd fail if some scenarios are not implemented, and to bind the ones not needing
+# parametrization. KEEP AT THE END
 scenarios(FEATURE_FILE)
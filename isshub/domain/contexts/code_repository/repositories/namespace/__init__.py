@@ -12,6 +12,8 @@ class AbstractNamespaceRepository(
 ):
     """Base repository for the :obj:`.Namespace` entity."""
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def for_namespace(
         self, namespace: Union[Namespace, Literal[None]]
@@ -38,33 +40,27 @@ class InMemoryNamespaceRepository(
 ):
     """Repository to handle :obj:`.Namespace` entities in memory."""
 
-    def add(self, entity: Namespace) -> Namespace:
-        """Add the given Namespace `entity` in the repository.
+    __slots__ = ()
 
-        For the parameters, see :obj:`AbstractRepository.add`.
+    def _check_uniqueness(self, entity: Namespace) -> None:
+        """Check that no other namespace has the same name in the same parent namespace.
 
-        Returns
-        -------
-        Namespace
-            The added Namespace
+        For the parameters, see :obj:`AbstractInMemoryRepository._check_uniqueness`.
 
         Raises
         ------
         self.UniquenessError
-            - If a namespace with the same identifier as the given one already exists.
-            - If a namespace with the same name and parent namespace (including no namespace) as
-              the given one already exists.
+            If a namespace with the same name and parent namespace (including no namespace) as
+            the given one already exists.
 
         """
         if any(
-            namespace
+            namespace.name == entity.name and namespace.identifier != entity.identifier
             for namespace in self.for_namespace(entity.namespace)
-            if namespace.name == entity.name
         ):
             raise self.UniquenessError(
                 f"One already exists with name={entity.name} and namespace={entity.namespace}"
             )
-        return super().add(entity)
 
     def for_namespace(
         self, namespace: Union[Namespace, Literal[None]]
@@ -79,4 +75,8 @@ class InMemoryNamespaceRepository(
             An iterable of the namespaces found in the `namespace`
 
         """
-        return (entity for entity in self._collection if entity.namespace == namespace)
+        return (
+            entity
+            for entity in self._collection.values()
+            if entity.namespace == namespace
+        )
@@ -21,6 +21,11 @@ Feature: Storing namespaces
         And it is updated
         Then I can retrieve its updated version
 
+    Scenario: An existing namespace can be updated without changing its name
+        When the namespace is added to the namespace storage
+        And it is updated without changing its name
+        Then I can retrieve it
+
     Scenario: An existing namespace cannot be saved if invalid
         When the namespace has some invalid content
         Then I cannot update it because it's invalid
@@ -68,6 +73,7 @@ Feature: Storing namespaces
         And the second namespace is added to the namespace storage
         And the second namespace name is set as for the first one
         Then I cannot update the second one
+        And the second namespace is still in the namespace storage
 
     Scenario: A namespace cannot be updated if another exists with same new name both without parent namespace
         Given a namespace without parent namespace
@@ -76,6 +82,7 @@ Feature: Storing namespaces
         And the second namespace is added to the namespace storage
         And the second namespace name is set as for the first one
         Then I cannot update the second one
+        And the second namespace is still in the namespace storage
 
     Scenario: A namespace cannot be updated if another exists with same name in new same parent namespace
         Given a second namespace with the same name
@@ -83,6 +90,7 @@ Feature: Storing namespaces
         And the second namespace is added to the namespace storage
         And the second namespace parent namespace is set as for the first one
         Then I cannot update the second one
+        And the second namespace is still in the namespace storage
 
     Scenario: A namespace cannot be updated if another exists with same name now both without namespace
         Given a namespace without parent namespace
@@ -91,6 +99,7 @@ Feature: Storing namespaces
         And the second namespace is added to the namespace storage
         And the second namespace parent namespace is cleared
         Then I cannot update the second one
+        And the second namespace is still in the namespace storage
 
     Scenario: A namespace can be moved from one parent namespace to another
         Given a parent namespace with no namespaces in it
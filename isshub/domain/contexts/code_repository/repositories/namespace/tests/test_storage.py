@@ -20,9 +20,16 @@ def test_add_new_namespace():
     pass
 
 
+@pytest.fixture(scope="session")
+def _any_parent_namespace(namespace_factory):
+    # No scenario updates or stores this parent, it's only read via the `namespace` field of
+    # its children, so it can be shared by all scenarios
+    return namespace_factory(namespace=None)
+
+
 @given("a namespace with a parent namespace", target_fixture="namespace")
-def a_namespace_with_parent_namespace(namespace_factory):
-    return namespace_factory(namespace=namespace_factory(namespace=None))
+def a_namespace_with_parent_namespace(namespace_factory, _any_parent_namespace):
+    return namespace_factory(namespace=_any_parent_namespace)
 
 
 @given("a namespace without parent namespace", target_fixture="namespace")
@@ -91,6 +98,17 @@ def retrieve_updated_from_namespace(namespace, namespace_storage):
     assert from_namespace.name == "new name"
 
 
+@scenario("An existing namespace can be updated without changing its name")
+def test_update_existing_namespace_keeping_its_name():
+    pass
+
+
+@when("it is updated without changing its name")
+def namespace_is_updated_keeping_its_name(namespace, namespace_storage):
+    # the namespace itself must not be seen as another one with the same name
+    namespace_storage.update(namespace)
+
+
 @scenario("An existing namespace cannot be saved if invalid")
 def test_update_invalid_namespace():
     pass
@@ -254,6 +272,11 @@ def other_namespace_cannot_be_updated(namespace_storage, namespace1):
         namespace_storage.update(namespace1)
 
 
+@then("the second namespace is still in the namespace storage")
+def other_namespace_still_stored(namespace_storage, namespace1):
+    assert namespace_storage.get(identifier=namespace1.identifier) is namespace1
+
+
 @scenario(
     "A namespace cannot be updated if another exists with same new name both without parent namespace"
 )
@@ -12,6 +12,8 @@ class AbstractRepositoryRepository(
 ):
     """Base repository for the :obj:`.Repository` entity."""
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def for_namespace(self, namespace: Namespace) -> Iterable[Repository]:
         """Iterate on repositories found in the given `namespace`.
@@ -34,32 +36,27 @@ class InMemoryRepositoryRepository(
 ):
     """Repository to handle :obj:`.Repository` entities in memory."""
 
-    def add(self, entity: Repository) -> Repository:
-        """Add the given Repository `entity` in the repository.
+    __slots__ = ()
 
-        For the parameters, see :obj:`AbstractRepository.add`.
+    def _check_uniqueness(self, entity: Repository) -> None:
+        """Check that no other repository has the same name in the same namespace.
 
-        Returns
-        -------
-        Repository
-            The added Repository
+        For the parameters, see :obj:`AbstractInMemoryRepository._check_uniqueness`.
 
         Raises
         ------
         self.UniquenessError
-            - If a repository with the same identifier as the given one already exists.
-            - If a repository with the same name and namespace as the given one already exists.
+            If a repository with the same name and namespace as the given one already exists.
 
         """
         if any(
-            repository
+            repository.name == entity.name
+            and repository.identifier != entity.identifier
             for repository in self.for_namespace(entity.namespace)
-            if repository.name == entity.name
         ):
             raise self.UniquenessError(
                 f"One already exists with name={entity.name} and namespace={entity.namespace}"
             )
-        return super().add(entity)
 
     def for_namespace(self, namespace: Namespace) -> Iterable[Repository]:
         """Iterate on repositories found in the given `namespace`.
@@ -72,4 +69,8 @@ class InMemoryRepositoryRepository(
             An iterable of the repositories found in the `namespace`
 
         """
-        return (entity for entity in self._collection if entity.namespace == namespace)
+        return (
+            entity
+            for entity in self._collection.values()
+            if entity.namespace == namespace
+        )
@@ -21,6 +21,11 @@ Feature: Storing repositories
         And it is updated
         Then I can retrieve its updated version
 
+    Scenario: An existing repository can be updated without changing its name
+        When the repository is added to the repository storage
+        And it is updated without changing its name
+        Then I can retrieve it
+
     Scenario: An existing repository cannot be saved if invalid
         When the repository has some invalid content
         Then I cannot update it because it's invalid
@@ -62,6 +67,7 @@ Feature: Storing repositories
         And the second repository is added to the repository storage
         And the second repository name is set as for the first one
         Then I cannot update the second one
+        And the second repository is still in the repository storage
 
     Scenario: A repository cannot be updated if another exists with same name in new same namespace
         Given a second repository with the same name
@@ -69,6 +75,7 @@ Feature: Storing repositories
         And the second repository is added to the repository storage
         And the second repository namespace is set as for the first one
         Then I cannot update the second one
+        And the second repository is still in the repository storage
 
     Scenario: A repository can be moved from one namespace to another
         Given a namespace with no repositories in it
@@ -87,6 +87,17 @@ def retrieve_updated_from_repository(repository, repository_storage):
     assert from_repository.name == "new name"
 
 
+@scenario("An existing repository can be updated without changing its name")
+def test_update_existing_repository_keeping_its_name():
+    pass
+
+
+@when("it is updated without changing its name")
+def repository_is_updated_keeping_its_name(repository, repository_storage):
+    # the repository itself must not be seen as another one with the same name
+    repository_storage.update(repository)
+
+
 @scenario("An existing repository cannot be saved if invalid")
 def test_update_invalid_repository():
     pass
@@ -237,6 +248,11 @@ def other_repository_cannot_be_updated(repository_storage, repository1):
         repository_storage.update(repository1)
 
 
+@then("the second repository is still in the repository storage")
+def other_repository_still_stored(repository_storage, repository1):
+    assert repository_storage.get(identifier=repository1.identifier) is repository1
+
+
 @scenario(
     "A repository cannot be updated if another exists with same name in new same namespace"
 )
@@ -3,11 +3,17 @@
 It is an adapter over the ``attrs`` external dependency.
 
 """
+import linecache
+import os
+from contextlib import contextmanager
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    Dict,
     Generic,
+    Iterator,
+    List,
     Optional,
     Type,
     TypeVar,
@@ -17,10 +23,16 @@ from typing import (
 from uuid import UUID
 
 import attr
+from attr import _config  # pylint: disable=protected-access
 
 
 _T = TypeVar("_T")
 
+#: If ``True``, classes decorated with :obj:`validated` will have their ``__init__`` replaced by
+#: the one generated by :obj:`compile_init`. Set via the ``ISSHUB_FAST_ENTITIES`` environment
+#: variable (``ISSHUB_FAST_ENTITIES=1``).
+FAST_ENTITIES = os.environ.get("ISSHUB_FAST_ENTITIES") == "1"
+
 if TYPE_CHECKING:
     from attr.__init__ import Attribute  # isort:skip
 else:
@@ -37,13 +49,46 @@ class _InstanceOfSelfValidator(
 ):
     """Validator checking that the field holds an instance of its own entity."""
 
-    def __call__(self, inst, attr, value):  # type: ignore  # pylint: disable=redefined-outer-name
+    # the parent class is slotted, so no ``__dict__`` is needed for this one, without any field
+    __slots__ = ()
+
+    def __call__(self, inst, field, value):  # type: ignore
         """Validate that the `value` is an instance of the class of `inst`.
 
         For the parameters, see ``attr.validators._InstanceOfValidator``
+
+        Notes
+        -----
+        The validator is shared by the subclasses of the entity defining the field, so its own
+        ``type`` is never set, and a validator for the class of `inst` is only created to raise
+        the exception if the check fails.
         """
-        self.type = inst.__class__
-        super().__call__(inst, attr, value)
+        if not isinstance(value, inst.__class__):
+            attr.validators.instance_of(inst.__class__)(inst, field, value)
+
+
+class _OptionalInstanceOfValidator(
+    attr.validators._InstanceOfValidator  # type: ignore  # pylint: disable=protected-access
+):
+    """Validator checking that the field is ``None`` or holds an instance of its ``type``.
+
+    It's the same as ``attr.validators.optional(attr.validators.instance_of(type))``, but in a
+    single call.
+    """
+
+    __slots__ = ()
+
+    def __call__(self, inst, field, value):  # type: ignore
+        """Validate that the `value` is ``None`` or an instance of the ``type`` of the validator.
+
+        For the parameters, see ``attr.validators._InstanceOfValidator``
+        """
+        if value is not None and not isinstance(value, self.type):
+            super().__call__(inst, field, value)
+
+    def __repr__(self) -> str:
+        """Represent the validator as the ``attrs`` optional one does."""
+        return f"<optional validator for <instance_of validator for type {self.type!r}> or None>"
 
 
 def instance_of_self() -> _InstanceOfSelfValidator:
@@ -57,6 +102,31 @@ def instance_of_self() -> _InstanceOfSelfValidator:
     return _InstanceOfSelfValidator(type=None)
 
 
+# validators for "self" fields, shared by all of them as they don't hold any state
+_SELF_VALIDATOR = instance_of_self()
+_OPTIONAL_SELF_VALIDATOR = attr.validators.optional(_SELF_VALIDATOR)
+
+
+def _field_metadata(relation_verbose_name: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Return the metadata of a field, or ``None`` if there is nothing to store.
+
+    Parameters
+    ----------
+    relation_verbose_name : Optional[str]
+        A verbose name to describe the relation between the entity linked to the field, and the
+        entity pointed by the type of the field
+
+    Returns
+    -------
+    Optional[Dict[str, Any]]
+        The metadata, ``None`` letting ``attrs`` use its own shared empty metadata.
+
+    """
+    if relation_verbose_name:
+        return {"relation_verbose_name": relation_verbose_name}
+    return None
+
+
 def optional_field(
     field_type: Union[Type[_T], str], relation_verbose_name: Optional[str] = None
 ) -> Optional[_T]:
@@ -65,8 +135,8 @@ def optional_field(
     Parameters
     ----------
     field_type : Union[type, str]
-        The expected type of the field. Use the string "self" to reference the current field's
-        entity
+        The expected type of the field. The string "self", to reference the current field's
+        entity, is still accepted, but :obj:`optional_self_field` should be used instead.
     relation_verbose_name : Optional[str]
         A verbose name to describe the relation between the entity linked to the field, and the
         entity pointed by `field_type`
@@ -93,21 +163,64 @@ def optional_field(
     >>> from isshub.domain.utils.testing.validation import check_field_nullable
     >>> check_field_nullable(MyEntity, 'my_field', my_field='foo')
 
+    Passing "self" is the same as using :obj:`optional_self_field`:
+
+    >>> @validated()
+    ... class MyParentEntity(BaseEntity):
+    ...     parent: Optional["MyParentEntity"] = optional_field("self")
+    >>>
+    >>> field, self_field = attr.fields(MyParentEntity).parent, optional_self_field()
+    >>> (field.default, field.validator) == (self_field._default, self_field._validator)
+    True
+    >>> check_field_nullable(MyParentEntity, 'parent', parent=MyParentEntity())
+    >>> MyParentEntity(parent='foo')
+    Traceback (most recent call last):
+        ...
+    TypeError: ("'parent' must be <class '...MyParentEntity'> (got 'foo' that is a <class 'str'>...
+
     """
-    metadata = {}
-    if relation_verbose_name:
-        metadata["relation_verbose_name"] = relation_verbose_name
+    if isinstance(field_type, str):
+        assert field_type == "self"
+        return cast(Optional[_T], optional_self_field(relation_verbose_name))
 
-    assert not isinstance(field_type, str) or field_type == "self"
+    return attr.ib(
+        default=None,
+        validator=_OptionalInstanceOfValidator(type=field_type),
+        metadata=_field_metadata(relation_verbose_name),
+    )
+
+
+def optional_self_field(relation_verbose_name: Optional[str] = None) -> Any:
+    """Define an optional field holding an entity of the same class as the current field's entity.
+
+    Parameters
+    ----------
+    relation_verbose_name : Optional[str]
+        A verbose name to describe the relation between the entity linked to the field, and the
+        entity pointed by the field
 
+    Returns
+    -------
+    Any
+        An ``attrs`` attribute, with a default value set to ``None``, and a validator checking
+        that this field is optional and, if set, of the correct type.
+
+    Examples
+    --------
+    >>> from isshub.domain.utils.entity import optional_self_field, validated, BaseEntity
+    >>>
+    >>> @validated()
+    ... class MyEntity(BaseEntity):
+    ...     parent: Optional["MyEntity"] = optional_self_field()
+    >>>
+    >>> from isshub.domain.utils.testing.validation import check_field_nullable
+    >>> check_field_nullable(MyEntity, 'parent', parent=MyEntity())
+
+    """
     return attr.ib(
         default=None,
-        validator=attr.validators.optional(
-            instance_of_self()
-            if isinstance(field_type, str)
-            else attr.validators.instance_of(field_type)
-        ),
-        metadata=metadata,
+        validator=_OPTIONAL_SELF_VALIDATOR,
+        metadata=_field_metadata(relation_verbose_name),
     )
 
 
@@ -121,8 +234,8 @@ def required_field(
     Parameters
     ----------
     field_type : Union[type, str]
-        The expected type of the field. Use the string "self" to reference the current field's
-        entity
+        The expected type of the field. The string "self", to reference the current field's
+        entity, is still accepted, but :obj:`required_self_field` should be used instead.
     frozen : bool
         If set to ``False`` (the default), the field can be updated after being set at init time.
         If set to ``True``, the field can be set at init time but cannot be changed later, else a
@@ -152,23 +265,71 @@ def required_field(
     >>> from isshub.domain.utils.testing.validation import check_field_not_nullable
     >>> check_field_not_nullable(MyEntity, 'my_field', my_field='foo')
 
+    Passing "self" is the same as using :obj:`required_self_field`:
+
+    >>> @validated()
+    ... class MyLinkedEntity(BaseEntity):
+    ...     other: "MyLinkedEntity" = required_field("self", frozen=True)
+    >>>
+    >>> field, self_field = attr.fields(MyLinkedEntity).other, required_self_field(frozen=True)
+    >>> (field.validator, field.on_setattr) == (self_field._validator, self_field.on_setattr)
+    True
+    >>> MyLinkedEntity(other='foo')
+    Traceback (most recent call last):
+        ...
+    TypeError: ("'other' must be <class '...MyLinkedEntity'> (got 'foo' that is a <class 'str'>)...
+
     """
-    metadata = {}
-    if relation_verbose_name:
-        metadata["relation_verbose_name"] = relation_verbose_name
+    if isinstance(field_type, str):
+        assert field_type == "self"
+        return cast(_T, required_self_field(frozen, relation_verbose_name))
+
+    return attr.ib(  # type: ignore
+        validator=attr.validators.instance_of(field_type),
+        metadata=_field_metadata(relation_verbose_name),
+        on_setattr=attr.setters.frozen if frozen else None,
+    )
 
-    assert not isinstance(field_type, str) or field_type == "self"
 
-    kwargs = {
-        "validator": instance_of_self()
-        if isinstance(field_type, str)
-        else attr.validators.instance_of(field_type),
-        "metadata": metadata,
-    }
-    if frozen:
-        kwargs["on_setattr"] = attr.setters.frozen
+def required_self_field(
+    frozen: bool = False, relation_verbose_name: Optional[str] = None
+) -> Any:
+    """Define a required field holding an entity of the same class as the current field's entity.
 
-    return attr.ib(**kwargs)  # type: ignore
+    Parameters
+    ----------
+    frozen : bool
+        If set to ``False`` (the default), the field can be updated after being set at init time.
+        If set to ``True``, the field can be set at init time but cannot be changed later, else a
+        ``FrozenAttributeError`` exception will be raised.
+    relation_verbose_name : Optional[str]
+        A verbose name to describe the relation between the entity linked to the field, and the
+        entity pointed by the field
+
+    Returns
+    -------
+    Any
+        An ``attrs`` attribute, and a validator checking that this field is of the correct type.
+
+    Examples
+    --------
+    >>> from isshub.domain.utils.entity import required_self_field, validated, BaseEntity
+    >>>
+    >>> @validated()
+    ... class MyEntity(BaseEntity):
+    ...     other: "MyEntity" = required_self_field()
+    >>>
+    >>> instance = MyEntity(other='foo')
+    Traceback (most recent call last):
+        ...
+    TypeError: ("'other' must be <class '...MyEntity'> (got 'foo' that is a <class 'str'>)...
+
+    """
+    return attr.ib(
+        validator=_SELF_VALIDATOR,
+        metadata=_field_metadata(relation_verbose_name),
+        on_setattr=attr.setters.frozen if frozen else None,
+    )
 
 
 def validated() -> Any:
@@ -178,6 +339,10 @@ def validated() -> Any:
     be passed as named arguments (this allows to not have to defined all required fields first, then
     optional ones, and resolves problems with inheritance where we can't handle the order)
 
+    The class then gets a ``_validate_fields`` method generated by :obj:`compile_validate`, called
+    by ``validate``, that can still be overridden by the entity. And if :obj:`FAST_ENTITIES` is ``True``, the ``__init__`` of the class
+    is replaced by the one generated by :obj:`compile_init`.
+
     Returns
     -------
     type
@@ -197,10 +362,12 @@ def validated() -> Any:
     >>> instance = MyEntity()
     Traceback (most recent call last):
         ...
-    TypeError: __init__() missing 1 required keyword-only argument: 'my_field'
+    TypeError: ...__init__() missing 1 required keyword-only argument: 'my_field'
     >>> instance = MyEntity(my_field='foo')
     >>> instance.my_field
     'foo'
+    >>> hasattr(instance, '__dict__')
+    False
     >>> instance.validate()
     >>> instance.my_field = None
     >>> instance.validate()
@@ -208,8 +375,402 @@ def validated() -> Any:
         ...
     TypeError: ("'my_field' must be <class 'str'> (got None that is a <class 'NoneType'>)...
 
+    An entity can define its own ``validate`` method, to check more than its fields:
+
+    >>> @validated()
+    ... class MyRangeEntity(BaseEntity):
+    ...     low: int = required_field(int)
+    ...     high: int = required_field(int)
+    ...
+    ...     def validate(self):
+    ...         super().validate()
+    ...         if self.low > self.high:
+    ...             raise ValueError('low must not be greater than high')
+    >>>
+    >>> instance = MyRangeEntity(low=1, high=2)
+    >>> instance.validate()
+    >>> instance.low = 3
+    >>> instance.validate()
+    Traceback (most recent call last):
+        ...
+    ValueError: low must not be greater than high
+    >>> instance.low = 'foo'
+    >>> instance.validate()
+    Traceback (most recent call last):
+        ...
+    TypeError: ("'low' must be <class 'int'> (got 'foo' that is a <class 'str'>)...
+
+    """
+    decorator = attr.s(slots=True, kw_only=True, eq=False)
+
+    def decorate(cls: Type[_T]) -> Type[_T]:
+        """Make `cls` an ``attrs`` class with compiled methods.
+
+        Parameters
+        ----------
+        cls : Type
+            The class to decorate.
+
+        Returns
+        -------
+        Type
+            The decorated class.
+
+        """
+        cls = compile_validate(decorator(cls))
+        return compile_init(cls) if FAST_ENTITIES else cls
+
+    return decorate
+
+
+def _iter_validators(validator: Any) -> Any:
+    """Iterate on the validators composing the given `validator`.
+
+    Parameters
+    ----------
+    validator : Any
+        A validator of an ``attrs`` attribute, or ``None``.
+
+    Yields
+    ------
+    Any
+        Each validator, validators composed with ``attr.validators.and_`` being flattened.
+
     """
-    return attr.s(slots=True, kw_only=True, eq=False)
+    if isinstance(
+        validator, attr._make._AndValidator  # pylint: disable=protected-access
+    ):
+        for sub_validator in validator._validators:  # pylint: disable=protected-access
+            yield from _iter_validators(sub_validator)
+    elif validator is not None:
+        yield validator
+
+
+def _validation_source(
+    field: "Attribute[Any]", value: str, namespace: Dict[str, Any]
+) -> List[str]:
+    """Get the source code lines validating the `value` of the given `field`.
+
+    The ``isinstance`` checks of the type validators are inlined, and the validator itself is only
+    called if the check fails, to raise its own exception. Other validators are simply called.
+
+    Parameters
+    ----------
+    field : Attribute
+        The ``attrs`` attribute to validate.
+    value : str
+        The python expression holding the value to validate.
+    namespace : Dict[str, Any]
+        The namespace in which the generated code will be executed. Will be updated with the names
+        used by the returned lines.
+
+    Returns
+    -------
+    List[str]
+        The lines of code, without indentation for the first level.
+
+    """
+    lines = []
+    namespace[f"_field_{field.name}"] = field
+    for index, validator in enumerate(_iter_validators(field.validator)):
+        name = f"_validator_{field.name}_{index}"
+        namespace[name] = validator
+        call = f"{name}(self, _field_{field.name}, {value})"
+
+        optional = isinstance(
+            validator,
+            attr.validators._OptionalValidator,  # pylint: disable=protected-access
+        )
+        inner = validator.validator if optional else validator
+        optional = optional or isinstance(inner, _OptionalInstanceOfValidator)
+        if isinstance(inner, _InstanceOfSelfValidator):
+            check = f"isinstance({value}, self.__class__)"
+        elif isinstance(
+            inner,
+            attr.validators._InstanceOfValidator,  # pylint: disable=protected-access
+        ):
+            namespace[f"_type_{field.name}_{index}"] = inner.type
+            check = f"isinstance({value}, _type_{field.name}_{index})"
+        else:
+            lines.append(call)
+            continue
+        if optional:
+            check = f"{value} is None or {check}"
+        lines.extend([f"if not ({check}):", f"    {call}"])
+
+    return lines
+
+
+def _compile_method(
+    cls: type, name: str, lines: List[str], namespace: Dict[str, Any]
+) -> Callable[..., Any]:
+    """Compile the method `name` of `cls` from the given source `lines`.
+
+    As ``attrs`` does for the methods it generates, the compiled method gets the module of `cls`,
+    and the docstring of the method it will replace.
+
+    Parameters
+    ----------
+    cls : type
+        The class for which the method is compiled.
+    name : str
+        The name of the method, as defined in `lines`.
+    lines : List[str]
+        The source code of the method.
+    namespace : Dict[str, Any]
+        The global namespace for the method.
+
+    Returns
+    -------
+    Callable
+        The compiled method, not yet attached to `cls`.
+
+    """
+    source = "\n".join(lines) + "\n"
+    filename = f"<isshub compiled {cls.__module__}.{cls.__qualname__}.{name}>"
+    exec(compile(source, filename, "exec"), namespace)  # pylint: disable=exec-used
+    # register the source, to have it in tracebacks
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+    method = namespace[name]
+    method.__qualname__ = f"{cls.__qualname__}.{name}"
+    method.__module__ = cls.__module__
+    method.__doc__ = getattr(cls, name).__doc__
+    return cast(Callable[..., Any], method)
+
+
+def compile_init(cls: Type[_T]) -> Type[_T]:
+    """Replace the ``__init__`` of `cls`, generated by ``attrs``, by a flat compiled one.
+
+    The ``__init__`` generated by ``attrs`` calls one validator per field, and ``attrs`` type
+    validators are python callables. The compiled one inlines the ``isinstance`` checks, only
+    calling the validator (to raise the exact same exception) if the check fails.
+
+    Classes using features not handled here (converters, factories as default values, fields not
+    in ``__init__`` or not passed as named arguments, ``__attrs_pre_init__``) are left untouched.
+
+    Called by :obj:`validated` if :obj:`FAST_ENTITIES` is ``True``.
+
+    Parameters
+    ----------
+    cls : type
+        A class decorated with :obj:`validated`.
+
+    Returns
+    -------
+    type
+        The same class, with its new ``__init__``.
+
+    Examples
+    --------
+    >>> from isshub.domain.utils.entity import optional_field, required_field, BaseEntity
+    >>>
+    >>> @validated()
+    ... class MyEntity(BaseEntity):
+    ...     my_field: str = required_field(str)
+    ...     my_other_field: int = optional_field(int)
+    >>>
+    >>> MyEntity = compile_init(MyEntity)
+    >>> instance = MyEntity(my_field='foo')
+    >>> (instance.my_field, instance.my_other_field)
+    ('foo', None)
+    >>> instance = MyEntity(my_field='foo', my_other_field='bar')
+    Traceback (most recent call last):
+        ...
+    TypeError: ("'my_other_field' must be <class 'int'> (got 'bar' that is a <class 'str'>)...
+
+    The compiled ``__init__`` behaves like the one generated by ``attrs``, including for frozen
+    fields, "self" fields, validators defined with :obj:`field_validator` and
+    ``__attrs_post_init__``:
+
+    >>> from isshub.domain.utils.entity import field_validator, optional_self_field
+    >>>
+    >>> def define_entity():
+    ...     class MyFullEntity(BaseEntity):
+    ...         code: str = required_field(str, frozen=True)
+    ...         parent: Optional["MyFullEntity"] = optional_self_field()
+    ...
+    ...         @field_validator(code)
+    ...         def validate_code(self, field, value):
+    ...             if value == 'bar':
+    ...                 raise ValueError('code must not be "bar"')
+    ...
+    ...         def __attrs_post_init__(self):
+    ...             if self.code == 'baz':
+    ...                 raise ValueError('code must not be "baz"')
+    ...     return attr.s(slots=True, kw_only=True, eq=False)(MyFullEntity)
+    >>>
+    >>> def init_outcome(cls, **kwargs):
+    ...     try:
+    ...         instance = cls(**kwargs)
+    ...     except (TypeError, ValueError) as exception:
+    ...         return exception.__class__, exception.args[0]
+    ...     return instance.code, instance.parent.__class__
+    >>>
+    >>> AttrsEntity, CompiledEntity = define_entity(), compile_init(define_entity())
+    >>> CompiledEntity.__init__ is not AttrsEntity.__init__
+    True
+    >>> CompiledEntity.__init__.__doc__
+    'Method generated by attrs for class define_entity.<locals>.MyFullEntity.'
+    >>> for kwargs in (
+    ...     {'code': 'foo'},
+    ...     {'code': 'foo', 'parent': None},
+    ...     {'code': 'foo', 'parent': 'foo'},
+    ...     {'code': 1},
+    ...     {'code': 'bar'},
+    ...     {'code': 'baz'},
+    ... ):
+    ...     assert init_outcome(AttrsEntity, **kwargs) == init_outcome(CompiledEntity, **kwargs)
+    >>> CompiledEntity(code='foo', parent=CompiledEntity(code='foo')).parent.code
+    'foo'
+    >>> CompiledEntity(code='foo', parent=AttrsEntity(code='foo'))
+    Traceback (most recent call last):
+        ...
+    TypeError: ("'parent' must be <class '...MyFullEntity'> (got MyFullEntity(code='foo', ...
+    >>> instance = CompiledEntity(code='foo')
+    >>> instance.code = 'qux'
+    Traceback (most recent call last):
+        ...
+    attr.exceptions.FrozenAttributeError
+
+    A class without fields gets an empty ``__init__``, and classes using features not handled are
+    left untouched:
+
+    >>> @validated()
+    ... class MyEmptyEntity(BaseEntity):
+    ...     pass
+    >>>
+    >>> compile_init(MyEmptyEntity)().validate()
+    >>>
+    >>> @validated()
+    ... class MyConvertedEntity(BaseEntity):
+    ...     my_field: str = attr.ib(converter=str)
+    >>>
+    >>> attrs_init = MyConvertedEntity.__init__
+    >>> compile_init(MyConvertedEntity).__init__ is attrs_init
+    True
+
+    """
+    fields = attr.fields(cls)
+    if hasattr(cls, "__attrs_pre_init__") or any(
+        not field.init
+        or not field.kw_only
+        or field.converter is not None
+        or isinstance(field.default, attr.Factory)  # type: ignore
+        for field in fields
+    ):
+        return cls
+
+    namespace: Dict[str, Any] = {"_config": _config, "_setattr": object.__setattr__}
+    # bypass the ``__setattr__`` generated by ``attrs`` for ``on_setattr`` hooks (like for
+    # frozen fields), as ``attrs`` does
+    direct_set = cls.__setattr__ is object.__setattr__  # type: ignore
+
+    arguments = ["self", "*"] if fields else ["self"]
+    assignments, validations = [], []
+    for field in fields:
+        argument = field.name.lstrip("_")
+        if field.default is attr.NOTHING:
+            arguments.append(argument)
+        else:
+            namespace[f"_default_{field.name}"] = field.default
+            arguments.append(f"{argument}=_default_{field.name}")
+        if direct_set:
+            assignments.append(f"self.{field.name} = {argument}")
+        else:
+            assignments.append(f"_setattr(self, {field.name!r}, {argument})")
+        validations.extend(_validation_source(field, argument, namespace))
+
+    lines = [f"def __init__({', '.join(arguments)}):"]
+    lines.extend(f"    {line}" for line in assignments)
+    if validations:
+        lines.append("    if _config._run_validators is True:")
+        lines.extend(f"        {line}" for line in validations)
+    if hasattr(cls, "__attrs_post_init__"):
+        lines.append("    self.__attrs_post_init__()")
+    if len(lines) == 1:
+        lines.append("    pass")
+
+    cls.__init__ = _compile_method(cls, "__init__", lines, namespace)  # type: ignore
+    return cls
+
+
+def compile_validate(cls: Type[_T]) -> Type[_T]:
+    """Set to `cls` a ``_validate_fields`` method compiled for its fields.
+
+    This method is called by the ``validate`` method of :obj:`BaseEntity`, so entities can still
+    define their own ``validate`` method.
+
+    ``attr.validate`` loops on the fields of the instance class at each call, to call their
+    validators. The compiled method checks all the fields in one flat function, inlining the
+    ``isinstance`` checks of type validators, and only calling them (to raise the exact same
+    exception) if the check fails. Other validators, like the ones defined with
+    :obj:`field_validator`, are called as ``attrs`` does.
+
+    If the method is called on an instance of a subclass of `cls` (a subclass not decorated with
+    :obj:`validated`), ``attr.validate`` is used, to validate the fields of the subclass too.
+
+    Called by :obj:`validated`.
+
+    Parameters
+    ----------
+    cls : type
+        A class decorated with :obj:`validated`.
+
+    Returns
+    -------
+    type
+        The same class, with its new ``_validate_fields`` method.
+
+    Examples
+    --------
+    >>> from isshub.domain.utils.entity import optional_field, required_field, BaseEntity
+    >>>
+    >>> @validated()
+    ... class MyEntity(BaseEntity):
+    ...     my_field: str = required_field(str)
+    ...     my_other_field: int = optional_field(int)
+    >>>
+    >>> MyEntity._validate_fields.__module__ == MyEntity.__module__
+    True
+    >>> MyEntity._validate_fields.__doc__ == BaseEntity._validate_fields.__doc__
+    True
+    >>> instance = MyEntity(my_field='foo')
+    >>> instance.validate()
+    >>> instance.my_other_field = 'bar'
+    >>> instance.validate()
+    Traceback (most recent call last):
+        ...
+    TypeError: ("'my_other_field' must be <class 'int'> (got 'bar' that is a <class 'str'>)...
+
+    """
+    namespace: Dict[str, Any] = {
+        "_config": _config,
+        "_cls": cls,
+        "_attrs_validate": attr.validate,
+    }
+
+    validations = []
+    for field in attr.fields(cls):
+        value = f"_value_{field.name}"
+        field_validations = _validation_source(field, value, namespace)
+        if field_validations:
+            validations.append(f"{value} = self.{field.name}")
+            validations.extend(field_validations)
+
+    lines = [
+        "def _validate_fields(self):",
+        "    if self.__class__ is not _cls:",
+        "        return _attrs_validate(self)",
+        "    if _config._run_validators is False:",
+        "        return None",
+    ]
+    lines.extend(f"    {line}" for line in validations)
+    lines.append("    return None")
+
+    cls._validate_fields = _compile_method(  # type: ignore  # pylint: disable=protected-access
+        cls, "_validate_fields", lines, namespace
+    )
+    return cls
 
 
 TValidateMethod = TypeVar(
@@ -286,6 +847,11 @@ class field_validator:  # pylint: disable=invalid-name
 def validate_instance(instance: Any) -> Any:
     """Validate a whole instance.
 
+    For entities, the ``_validate_fields`` method compiled for their class by
+    :obj:`compile_validate` is used, not their ``validate`` method, so that a ``validate`` method
+    defined by an entity can itself call this function. Other ``attrs`` instances are validated by
+    ``attr.validate``.
+
     Parameters
     ----------
     instance : Any
@@ -312,8 +878,86 @@ def validate_instance(instance: Any) -> Any:
         ...
     TypeError: ("'my_field' must be <class 'str'> (got None that is a <class 'NoneType'>)...
 
+    It can be used by the ``validate`` method of an entity:
+
+    >>> @validated()
+    ... class MyCheckedEntity(BaseEntity):
+    ...    my_field: str = required_field(str)
+    ...
+    ...    def validate(self):
+    ...        validate_instance(self)
+    ...        if not self.my_field:
+    ...            raise ValueError('my_field must not be empty')
+    >>>
+    >>> instance = MyCheckedEntity(my_field='')
+    >>> instance.validate()
+    Traceback (most recent call last):
+        ...
+    ValueError: my_field must not be empty
+
+    """
+    if isinstance(instance, BaseEntity):
+        instance._validate_fields()  # pylint: disable=protected-access
+    else:
+        attr.validate(instance)
+
+
+@contextmanager
+def validation_disabled() -> Iterator[None]:
+    """Context manager in which entities can be created without being validated.
+
+    It's useful in tests when the created entities are known to be valid and only their structure
+    is checked: creating them is then a simple assignment of their fields. The ``validate`` method
+    of entities does nothing either in this context.
+
+    When exiting, validation is set back to its state when entering, so it stays disabled when
+    exiting a nested context.
+
+    As validation is disabled for the whole process, this is not thread-safe: validation is
+    disabled in all threads in this context.
+
+    Yields
+    ------
+    None
+        Validation is disabled until exiting.
+
+    Examples
+    --------
+    >>> from isshub.domain.utils.entity import required_field, validated, BaseEntity
+    >>>
+    >>> @validated()
+    ... class MyEntity(BaseEntity):
+    ...     my_field: str = required_field(str)
+    >>>
+    >>> with validation_disabled():
+    ...     instance = MyEntity(my_field=None)
+    >>> instance.my_field is None
+    True
+    >>> instance.validate()
+    Traceback (most recent call last):
+        ...
+    TypeError: ("'my_field' must be <class 'str'> (got None that is a <class 'NoneType'>)...
+
+    It can be nested:
+
+    >>> with validation_disabled():
+    ...     with validation_disabled():
+    ...         pass
+    ...     instance = MyEntity(my_field=None)
+    >>> instance.my_field is None
+    True
+    >>> MyEntity(my_field=None)
+    Traceback (most recent call last):
+        ...
+    TypeError: ("'my_field' must be <class 'str'> (got None that is a <class 'NoneType'>)...
+
     """
-    attr.validate(instance)
+    previous = attr.validators.get_disabled()
+    attr.validators.set_disabled(True)
+    try:
+        yield
+    finally:
+        attr.validators.set_disabled(previous)
 
 
 def validate_positive_integer(
@@ -333,7 +977,7 @@ def validate_positive_integer(
     Raises
     ------
     TypeError
-        If `value` is not of type ``int``.
+        If `value` is not of type ``int`` (booleans are refused).
     ValueError
         If `value` is not a positive integer (ie > 0), or ``None`` if `none_allowed` is ``True``.
 
@@ -369,6 +1013,10 @@ def validate_positive_integer(
     Traceback (most recent call last):
         ...
     TypeError: ("'my_field' must be <class 'int'> (got 1.1 that is a <class 'float'>)...
+    >>> instance = MyEntity(my_field=True)
+    Traceback (most recent call last):
+        ...
+    TypeError: MyEntity.my_field must be a positive integer
     >>> instance = MyEntity(my_field=1)
     >>> instance.my_field = -2
     >>> instance.validate()
@@ -377,15 +1025,30 @@ def validate_positive_integer(
     ValueError: MyEntity.my_field must be a positive integer
 
     """
+    # fast path for the most common case: an exact ``int``
+    value_type = value.__class__
+    if value_type is int:
+        if value > 0:
+            return
+        raise ValueError(f"{display_name} must be a positive integer")
+
     if none_allowed and value is None:
         return
 
-    if not isinstance(value, int):
+    # ``bool`` is a subclass of ``int`` but ``True`` is not a valid positive integer
+    if value_type is bool or not isinstance(value, int):
         raise TypeError(f"{display_name} must be a positive integer")
     if value <= 0:
         raise ValueError(f"{display_name} must be a positive integer")
 
 
+# bits of the version (4 bits at position 76) and variant (2 bits at position 62) of a UUID, and
+# their values for a UUID version 4, of the RFC 4122 variant (the ``version`` property of a UUID is
+# ``None`` for other variants)
+_UUID4_MASK = (0xF << 76) | (0xC000 << 48)
+_UUID4_BITS = (4 << 76) | (0x8000 << 48)
+
+
 def validate_uuid(value: Any, none_allowed: bool, display_name: str) -> None:
     """Validate that the given `value` is a uuid (version 4) (``None`` accepted if `none_allowed`).
 
@@ -439,7 +1102,33 @@ def validate_uuid(value: Any, none_allowed: bool, display_name: str) -> None:
         ...
     TypeError: MyEntity.my_field must be a UUID version 4
 
+    Values that are not exact ``UUID`` instances are validated too:
+
+    >>> validate_uuid(None, none_allowed=True, display_name='my_field')
+    >>> validate_uuid(None, none_allowed=False, display_name='my_field')
+    Traceback (most recent call last):
+        ...
+    TypeError: my_field must be a UUID version 4
+    >>> validate_uuid('7298d61a-f08f-4f83-b75e-934e786eb43d', False, 'my_field')
+    Traceback (most recent call last):
+        ...
+    TypeError: my_field must be a UUID version 4
+    >>>
+    >>> class MyUUID(UUID):
+    ...     pass
+    >>>
+    >>> validate_uuid(MyUUID('7298d61a-f08f-4f83-b75e-934e786eb43d'), False, 'my_field')
+    >>> validate_uuid(MyUUID('19f49bc8-06e5-11eb-8465-bf44725d7bd3'), False, 'my_field')
+    Traceback (most recent call last):
+        ...
+    TypeError: my_field must be a UUID version 4
+
     """
+    # fast path for the most common case: an exact, valid, ``UUID``, checking the bits of the
+    # version and variant directly, instead of using the ``version`` property
+    if value.__class__ is UUID and value.int & _UUID4_MASK == _UUID4_BITS:
+        return
+
     if none_allowed and value is None:
         return
 
@@ -454,17 +1143,44 @@ class BaseEntity:
     def validate(self) -> None:
         """Validate all fields of the current instance.
 
+        Entities can override this method to add their own checks, calling ``super().validate()``
+        to keep the validation of their fields.
+
         Raises
         ------
         TypeError, ValueError
             If a field is not valid.
 
         """
-        validate_instance(self)
+        self._validate_fields()
+
+    # replaced by a compiled method, with the same docstring, in each class decorated with
+    # ``validated`` (see ``compile_validate``)
+    def _validate_fields(self) -> None:
+        """Validate all fields of the current instance, as ``attr.validate`` does.
+
+        Raises
+        ------
+        TypeError, ValueError
+            If a field is not valid.
+
+        """
+        attr.validate(self)
+
+
+class _HashCache:  # pylint: disable=too-few-public-methods
+    """Mixin adding a slot to cache the hash of an entity.
+
+    ``attrs`` sets the ``__slots__`` of the classes it handles to their fields only, so the slot
+    must be defined in a base class not handled by ``attrs``. It's not an ``attrs`` field, so it's
+    not part of the ``__init__``, of the ``repr``, or of the fields of the entities.
+    """
+
+    __slots__ = ("_hash_cache",)
 
 
 @validated()
-class BaseEntityWithIdentifier(BaseEntity):
+class BaseEntityWithIdentifier(BaseEntity, _HashCache):
     """A base entity with an :obj:`~BaseEntityWithIdentifier.identifier`, that is able to validate itself.
 
     Attributes
@@ -476,6 +1192,21 @@ class BaseEntityWithIdentifier(BaseEntity):
 
     identifier: UUID = required_field(UUID, frozen=True)
 
+    # name of the identifier field to display in errors, set for each subclass
+    _identifier_display_name = "BaseEntityWithIdentifier.identifier"
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Set the name of the identifier field to display in errors for the new subclass.
+
+        Parameters
+        ----------
+        kwargs : Any
+            Arguments passed to ``super().__init_subclass__``
+
+        """
+        super().__init_subclass__(**kwargs)  # type: ignore
+        cls._identifier_display_name = f"{cls.__name__}.identifier"
+
     @field_validator(identifier)
     def validate_id_is_uuid(  # noqa  # pylint: disable=unused-argument
         self, field: "Attribute[_T]", value: _T
@@ -493,7 +1224,7 @@ class BaseEntityWithIdentifier(BaseEntity):
         validate_uuid(
             value=value,
             none_allowed=False,
-            display_name=f"{self.__class__.__name__}.identifier",
+            display_name=self._identifier_display_name,
         )
 
     def __hash__(self) -> int:
@@ -509,8 +1240,46 @@ class BaseEntityWithIdentifier(BaseEntity):
         int
             The hash for the entity
 
+        Notes
+        -----
+        The identifier being frozen, the hash is computed only once per instance, and cached.
+
+        For a ``UUID`` identifier, we directly hash its ``int`` value, as ``UUID.__hash__`` does.
+        The result is the same.
+
+        Examples
+        --------
+        >>> from uuid import UUID, uuid4
+        >>>
+        >>> @validated()
+        ... class MyEntity(BaseEntityWithIdentifier):
+        ...     pass
+        >>>
+        >>> class MyUUID(UUID):
+        ...     pass
+        >>>
+        >>> identifier = uuid4()
+        >>> hash(MyEntity(identifier=identifier)) == hash(identifier)
+        True
+        >>> hash(MyEntity(identifier=MyUUID(str(identifier)))) == hash(identifier)
+        True
+        >>> with validation_disabled():
+        ...     entity = MyEntity(identifier='foo')
+        >>> hash(entity) == hash(entity) == hash('foo')
+        True
+
         """
-        return hash(self.identifier)
+        try:
+            return self._hash_cache  # type: ignore
+        except AttributeError:
+            pass
+        identifier = self.identifier
+        if identifier.__class__ is UUID:
+            entity_hash = hash(identifier.int)  # pylint: disable=no-member
+        else:
+            entity_hash = hash(identifier)
+        object.__setattr__(self, "_hash_cache", entity_hash)
+        return entity_hash
 
     def __eq__(self, other: Any) -> bool:
         """Check if the `other` object is the same as the current entity.
@@ -526,5 +1295,47 @@ class BaseEntityWithIdentifier(BaseEntity):
             ``True`` if the given `other` object is an instance of the same class as the current
             entity, with the same identifier.
 
+        Notes
+        -----
+        An entity is always equal to itself, so this case is checked first, without comparing the
+        identifiers (it's the case when getting back an entity from an in-memory repository).
+
+        For ``UUID`` identifiers, we directly compare their ``int`` values, as ``UUID.__eq__``
+        does, to avoid a python call. The result is the same.
+
+        Examples
+        --------
+        >>> from uuid import UUID, uuid4
+        >>>
+        >>> @validated()
+        ... class MyEntity(BaseEntityWithIdentifier):
+        ...     pass
+        >>>
+        >>> identifier = uuid4()
+        >>> entity = MyEntity(identifier=identifier)
+        >>> entity == MyEntity(identifier=identifier), entity == MyEntity(identifier=uuid4())
+        (True, False)
+        >>> entity == entity, entity == identifier
+        (True, False)
+
+        Identifiers that are not exact ``UUID`` instances are compared as usual:
+
+        >>> class MyUUID(UUID):
+        ...     pass
+        >>>
+        >>> entity == MyEntity(identifier=MyUUID(str(identifier)))
+        True
+        >>> with validation_disabled():
+        ...     entity, other_entity = MyEntity(identifier='foo'), MyEntity(identifier='foo')
+        >>> entity == other_entity, entity == MyEntity(identifier=identifier)
+        (True, False)
+
         """
-        return self.__class__ is other.__class__ and self.identifier == other.identifier
+        if self is other:
+            return True
+        if self.__class__ is not other.__class__:
+            return False
+        identifier, other_identifier = self.identifier, other.identifier
+        if identifier.__class__ is UUID and other_identifier.__class__ is UUID:
+            return identifier.int == other_identifier.int  # pylint: disable=no-member
+        return identifier == other_identifier
@@ -16,7 +16,9 @@ from mypy.plugins.attrs import attr_attrib_makers, attr_class_makers
 
 attr_class_makers.add("isshub.domain.utils.entity.validated")
 attr_attrib_makers.add("isshub.domain.utils.entity.optional_field")
+attr_attrib_makers.add("isshub.domain.utils.entity.optional_self_field")
 attr_attrib_makers.add("isshub.domain.utils.entity.required_field")
+attr_attrib_makers.add("isshub.domain.utils.entity.required_self_field")
 
 
 class MypyPlugin(Plugin):
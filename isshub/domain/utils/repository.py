@@ -2,7 +2,7 @@
 
 import abc
 from inspect import isabstract
-from typing import Any, Generic, Optional, Set, Type, TypeVar
+from typing import Any, Dict, Generic, Optional, Type, TypeVar
 from uuid import UUID
 
 from isshub.domain.utils.entity import BaseEntityWithIdentifier
@@ -42,10 +42,10 @@ class RepositoryException(Exception):
         if repository:
             self.repository = repository
         if self.repository is not None:
-            entity_name = ""
-            if self.repository.entity_class is not None:
-                entity_name = f"[{self.repository.entity_class.__name__}]"
-            message = f"{self.repository.__name__}{entity_name}: {message}"
+            # pylint: disable=protected-access
+            prefix = self.repository._exception_prefix
+            # pylint: enable=protected-access
+            message = f"{prefix}{message}"
         super().__init__(message)
 
 
@@ -72,10 +72,16 @@ class AbstractRepository(abc.ABC, Generic[Entity]):
 
     """
 
+    # repositories have no instance state but the ones defined by subclasses
+    __slots__ = ()
+
     entity_class: Optional[Type[Entity]] = None
     NotFoundError: Type[NotFoundError]
     UniquenessError: Type[UniquenessError]
 
+    # prefix of the messages of the exceptions raised by the repository, set for each subclass
+    _exception_prefix = "AbstractRepository: "
+
     def __init_subclass__(
         cls,
         abstract: bool = False,
@@ -102,10 +108,9 @@ class AbstractRepository(abc.ABC, Generic[Entity]):
         """
         super().__init_subclass__(**kwargs)  # type: ignore
         if entity_class is None:
-            for klass in cls.mro():
-                if issubclass(klass, AbstractRepository) and klass.entity_class:
-                    entity_class = klass.entity_class
-                    break
+            # ``entity_class`` is only set on classes defined with one, so the usual attribute
+            # lookup gets the one of the nearest parent class in the MRO (or ``None``)
+            entity_class = cls.entity_class
         if entity_class is None:
             if not (isabstract(cls) or abstract):
                 raise TypeError(
@@ -113,9 +118,16 @@ class AbstractRepository(abc.ABC, Generic[Entity]):
                 )
         else:
             cls.entity_class = entity_class
-        cls.NotFoundError = type("NotFoundError", (NotFoundError,), {"repository": cls})
+        cls._exception_prefix = (
+            f"{cls.__name__}: "
+            if entity_class is None
+            else f"{cls.__name__}[{entity_class.__name__}]: "
+        )
+        # ``type`` copies the namespace, so both exceptions can be created from the same one
+        exception_namespace = {"repository": cls}
+        cls.NotFoundError = type("NotFoundError", (NotFoundError,), exception_namespace)
         cls.UniquenessError = type(
-            "UniquenessError", (UniquenessError,), {"repository": cls}
+            "UniquenessError", (UniquenessError,), exception_namespace
         )
 
     def exists(self, identifier: UUID) -> bool:
@@ -213,11 +225,16 @@ class AbstractInMemoryRepository(AbstractRepository[Entity], abstract=True):
     The class is created with ``abstract=True`` because as all methods from the :obj:`AbstractRepository`
     are defined, it is not viewed as abstract by ``inspect.isabstract``.
 
+    Subclasses must define ``__slots__`` (empty if they have no instance attributes) to keep
+    the instances without ``__dict__``.
+
     """
 
+    __slots__ = ("_collection",)
+
     def __init__(self) -> None:
-        """Initialize the repository with an empty collection (a set)."""
-        self._collection: Set[Entity] = set()
+        """Initialize the repository with an empty collection (a dict by identifier)."""
+        self._collection: Dict[UUID, Entity] = {}
         super().__init__()
 
     def exists(self, identifier: UUID) -> bool:
@@ -231,9 +248,7 @@ class AbstractInMemoryRepository(AbstractRepository[Entity], abstract=True):
             ``True`` if an entity with the given UUID exists. ``False`` otherwise.
 
         """
-        return any(
-            entity for entity in self._collection if entity.identifier == identifier
-        )
+        return identifier in self._collection
 
     def add(self, entity: Entity) -> Entity:
         """Add the given `entity` in the repository.
@@ -252,17 +267,20 @@ class AbstractInMemoryRepository(AbstractRepository[Entity], abstract=True):
         Raises
         ------
         self.UniquenessError
-            If an entity with the same identifier as the given one already exists.
+            - If an entity with the same identifier as the given one already exists.
+            - If the entity conflicts with another one (see :obj:`_check_uniqueness`).
 
         """
         entity.validate()
 
-        if self.exists(entity.identifier):
+        # not using ``exists`` to save a method call
+        if entity.identifier in self._collection:
             raise self.UniquenessError(
                 f"One already exists with identifier={entity.identifier}"
             )
+        self._check_uniqueness(entity)
 
-        self._collection.add(entity)
+        self._collection[entity.identifier] = entity
         return entity
 
     def get(self, identifier: UUID) -> Entity:
@@ -282,10 +300,8 @@ class AbstractInMemoryRepository(AbstractRepository[Entity], abstract=True):
 
         """
         try:
-            return [
-                entity for entity in self._collection if entity.identifier == identifier
-            ][0]
-        except IndexError as exception:
+            return self._collection[identifier]
+        except KeyError as exception:
             raise self.NotFoundError(
                 f"Unable to find one with identifier={identifier}"
             ) from exception
@@ -308,11 +324,41 @@ class AbstractInMemoryRepository(AbstractRepository[Entity], abstract=True):
         ------
         self.NotFoundError
             If no entity was found matching the given one
+        self.UniquenessError
+            If the entity conflicts with another one (see :obj:`_check_uniqueness`).
 
         """
         entity.validate()
-        self.delete(entity)
-        return self.add(entity)
+
+        if entity.identifier not in self._collection:
+            raise self.NotFoundError(
+                f"Unable to find one with identifier={entity.identifier}"
+            )
+        self._check_uniqueness(entity)
+
+        # replace the stored entity in place
+        self._collection[entity.identifier] = entity
+        return entity
+
+    def _check_uniqueness(self, entity: Entity) -> None:
+        """Check that the given `entity` does not conflict with another one in the repository.
+
+        Called by :obj:`add` and :obj:`update`, after checking the identifier, to be overridden by
+        repositories having other uniqueness constraints. The stored entity with the same
+        identifier as the given one, if any, must not be considered as a conflict, as it's the one
+        to update.
+
+        Parameters
+        ----------
+        entity : Entity
+            The entity to check.
+
+        Raises
+        ------
+        self.UniquenessError
+            If the entity conflicts with another one. Never raised in this base class.
+
+        """
 
     def delete(self, entity: Entity) -> None:
         """Delete the given `entity` from the repository.
@@ -325,5 +371,9 @@ class AbstractInMemoryRepository(AbstractRepository[Entity], abstract=True):
             If no entity was found matching the given one
 
         """
-        entity = self.get(entity.identifier)
-        self._collection.remove(entity)
+        try:
+            del self._collection[entity.identifier]
+        except KeyError as exception:
+            raise self.NotFoundError(
+                f"Unable to find one with identifier={entity.identifier}"
+            ) from exception
@@ -0,0 +1,14 @@
+"""Step parsers shared by the BDD tests describing isshub entities.
+
+Regular expressions are used instead of ``parse`` patterns, as they are compiled once and matched
+by the ``re`` module.
+
+"""
+
+from pytest_bdd import parsers
+
+
+FIELD_NAMED = parsers.re(r"it must have a field named (?P<field_name>\w+)$")
+FIELD_TYPE = parsers.re(r"its (?P<field_name>\w+) must be a (?P<field_type>\S+)$")
+FIELD_MANDATORY = parsers.re(r"its (?P<field_name>\w+) is mandatory$")
+FIELD_OPTIONAL = parsers.re(r"its (?P<field_name>\w+) is optional$")
@@ -1,18 +1,21 @@
 """Validation helpers for BDD tests for isshub entities."""
 
-from typing import Any, Callable, List, Optional, Tuple, Type
+from typing import Any, Callable, Dict, Optional, Tuple, Type
 from uuid import UUID
 
 import pytest
 
-from attr.exceptions import FrozenAttributeError
+import attr
+from attr.exceptions import (  # noqa  # pylint: disable=unused-import
+    FrozenAttributeError,
+)
 
 from isshub.domain.utils.entity import BaseEntity
 
 
-ValuesValidation = List[Tuple[Any, Optional[Type[Exception]]]]
+ValuesValidation = Tuple[Tuple[Any, Optional[Type[Exception]]], ...]
 
-integer_only: ValuesValidation = [
+integer_only: ValuesValidation = (
     ("foo", TypeError),
     (-123, ValueError),
     (-1.5, TypeError),
@@ -22,19 +25,141 @@ integer_only: ValuesValidation = [
     (1, None),
     (1.5, TypeError),
     (123, None),
-]
+)
 
-no_zero: ValuesValidation = [(0, ValueError)]
+no_zero: ValuesValidation = ((0, ValueError),)
 
 positive_integer_only: ValuesValidation = integer_only + no_zero
 
-string_only: ValuesValidation = [("foo", None), (1, TypeError), (-0.1, TypeError)]
+string_only: ValuesValidation = (("foo", None), (1, TypeError), (-0.1, TypeError))
 
-uuid4_only: ValuesValidation = [
+uuid4_only: ValuesValidation = (
     (UUID("19f49bc8-06e5-11eb-8465-bf44725d7bd3"), TypeError),
     ("7298d61a-f08f-4f83-b75e-934e786eb43d", TypeError),
     (UUID("7298d61a-f08f-4f83-b75e-934e786eb43d"), None),
-]
+)
+
+
+def set_field_value(obj: BaseEntity, field_name: str, value: Any) -> bool:
+    """Set the `value` of the field `field_name` of `obj`, without any validation.
+
+    The value is set via ``object.__setattr__``, to skip the ``on_setattr`` hooks (and the
+    ``__setattr__`` generated by ``attrs`` for classes having some), except for frozen fields,
+    that are not updated.
+
+    Parameters
+    ----------
+    obj : BaseEntity
+        The object to update
+    field_name : str
+        The name of the field to update
+    value : Any
+        The value to set to the field
+
+    Returns
+    -------
+    bool
+        ``False`` if the field is frozen and was not updated, ``True`` otherwise.
+
+    """
+    if (
+        getattr(attr.fields(obj.__class__), field_name).on_setattr
+        is attr.setters.frozen
+    ):
+        return False
+    object.__setattr__(obj, field_name, value)
+    return True
+
+
+def _try_call(
+    func: Callable[..., Any], **kwargs: Any
+) -> Tuple[Optional[Exception], Any]:
+    """Call `func` with the given `kwargs`, returning the exception instead of raising it.
+
+    Parameters
+    ----------
+    func : Callable[...,Any]
+        The function to call, like an entity factory or the ``validate`` method of an entity
+    kwargs : Any
+        Any kwargs to pass to `func`
+
+    Returns
+    -------
+    Tuple[Optional[Exception], Any]
+        The exception raised by `func` (or ``None``) and the result of `func` (or ``None`` if an
+        exception was raised).
+
+    """
+    try:
+        return None, func(**kwargs)
+    except Exception as exc:  # pylint: disable=broad-except
+        return exc, None
+
+
+def _check_raised(
+    raised: Optional[Exception], expected: Optional[Type[Exception]]
+) -> None:
+    """Assert that the `raised` exception, as returned by ``_try_call``, is the `expected` one.
+
+    Parameters
+    ----------
+    raised : Optional[Exception]
+        The exception raised, if any
+    expected : Optional[Type[Exception]]
+        The type of the exception expected to be raised. If ``None``, no exception is expected.
+
+    Raises
+    ------
+    Exception
+        The `raised` exception, if it is not an instance of `expected`
+    pytest.fail.Exception
+        If no exception was raised but `expected` is not ``None`` (via ``pytest.fail``, as
+        ``pytest.raises`` does)
+
+    Examples
+    --------
+    >>> _check_raised(None, None)
+    >>> _check_raised(ValueError("foo"), ValueError)
+    >>> _check_raised(None, ValueError)
+    Traceback (most recent call last):
+        ...
+    Failed: DID NOT RAISE <class 'ValueError'>
+    >>> _check_raised(TypeError("foo"), ValueError)
+    Traceback (most recent call last):
+        ...
+    TypeError: foo
+    >>> _check_raised(TypeError("foo"), None)
+    Traceback (most recent call last):
+        ...
+    TypeError: foo
+
+    """
+    if raised is None:
+        if expected is not None:
+            pytest.fail(f"DID NOT RAISE {expected}")
+    elif expected is None or not isinstance(raised, expected):
+        raise raised
+
+
+def _without_field(factory_kwargs: Dict[str, Any], field_name: str) -> Dict[str, Any]:
+    """Get the `factory_kwargs` without the `field_name` entry.
+
+    Parameters
+    ----------
+    factory_kwargs : Dict[str, Any]
+        The kwargs to pass to a factory
+    field_name : str
+        The name of the field to remove from `factory_kwargs`
+
+    Returns
+    -------
+    Dict[str, Any]
+        `factory_kwargs` itself if it has no `field_name` entry, else a copy without it.
+
+    """
+    if field_name not in factory_kwargs:
+        return factory_kwargs
+    return {name: value for name, value in factory_kwargs.items() if name != field_name}
 
 
 def check_field(obj: BaseEntity, field_name: str) -> None:
@@ -86,37 +211,25 @@ def check_field_value(
         or if no exception is raised if `exception` is not ``None`` (or the wrong exception).
 
     """
-    factory_kwargs_copy = factory_kwargs.copy()
-    factory_kwargs_copy.pop(field_name, None)
-
-    if exception:
-        # When creating an instance
-        with pytest.raises(exception):
-            factory(**{field_name: value}, **factory_kwargs_copy)
-        # When updating the value
-        obj = factory(**factory_kwargs)
-        try:
-            setattr(obj, field_name, value)
-        except FrozenAttributeError:
-            pass
-        else:
-            with pytest.raises(exception):
-                obj.validate()
-    else:
-        # When creating an instance
-        factory(**{field_name: value}, **factory_kwargs_copy)
-        # When updating the value
+    # When creating an instance
+    raised, obj = _try_call(
+        factory, **{field_name: value}, **_without_field(factory_kwargs, field_name)
+    )
+    _check_raised(raised, exception)
+
+    # When updating the value: we reuse the created instance if any, as ``validate`` only depends
+    # on the final values of the fields
+    if obj is None:
         obj = factory(**factory_kwargs)
-        try:
-            setattr(obj, field_name, value)
-        except FrozenAttributeError:
-            pass
-        else:
-            obj.validate()
+    if set_field_value(obj, field_name, value):
+        _check_raised(_try_call(obj.validate)[0], exception)
 
 
 def check_field_not_nullable(
-    factory: Callable[..., BaseEntity], field_name: str, **factory_kwargs: Any
+    factory: Callable[..., BaseEntity],
+    field_name: str,
+    instance: Optional[BaseEntity] = None,
+    **factory_kwargs: Any,
 ) -> None:
     """Assert that an object cannot have a specific field set to ``None``.
 
@@ -126,6 +239,9 @@ def check_field_not_nullable(
         The factory to use to create the object to test
     field_name : str
         The name of the field to check
+    instance : Optional[BaseEntity]
+        An already created object to use to check the update, instead of creating one with the
+        `factory`. Its `field_name` field will be updated.
     factory_kwargs : Any
         Any kwargs to pass to the factory to create the object
 
@@ -137,24 +253,23 @@ def check_field_not_nullable(
 
     """
     # When creating an instance
-    factory_kwargs_copy = factory_kwargs.copy()
-    factory_kwargs_copy.pop(field_name, None)
-    with pytest.raises(TypeError):
-        factory(**{field_name: None}, **factory_kwargs_copy)
+    factory_kwargs_without_field = _without_field(factory_kwargs, field_name)
+    _check_raised(
+        _try_call(factory, **{field_name: None}, **factory_kwargs_without_field)[0],
+        TypeError,
+    )
 
     # When updating the value
-    obj = factory(**factory_kwargs)
-    try:
-        setattr(obj, field_name, None)
-    except FrozenAttributeError:
-        pass
-    else:
-        with pytest.raises(TypeError):
-            obj.validate()
+    obj = factory(**factory_kwargs) if instance is None else instance
+    if set_field_value(obj, field_name, None):
+        _check_raised(_try_call(obj.validate)[0], TypeError)
 
 
 def check_field_nullable(
-    factory: Callable[..., BaseEntity], field_name: str, **factory_kwargs: Any
+    factory: Callable[..., BaseEntity],
+    field_name: str,
+    instance: Optional[BaseEntity] = None,
+    **factory_kwargs: Any,
 ) -> None:
     """Assert that an object can have a specific field set to ``None``.
 
@@ -164,6 +279,9 @@ def check_field_nullable(
         The factory to use to create the object to test
     field_name : str
         The name of the field to check
+    instance : Optional[BaseEntity]
+        An already created object to use to check the update, instead of creating one with the
+        `factory`. Its `field_name` field will be updated.
     factory_kwargs : Any
         Any kwargs to pass to the factory to create the object
 
@@ -175,20 +293,15 @@ def check_field_nullable(
 
     """
     # When creating an instance
-    factory_kwargs_copy = factory_kwargs.copy()
-    factory_kwargs_copy.pop(field_name, None)
+    factory_kwargs_without_field = _without_field(factory_kwargs, field_name)
     try:
-        factory(**{field_name: None}, **factory_kwargs_copy)
+        factory(**{field_name: None}, **factory_kwargs_without_field)
     except TypeError:
         pytest.fail(f"DID RAISE {TypeError}")
 
     # When updating the value
-    obj = factory(**factory_kwargs)
-    try:
-        setattr(obj, field_name, None)
-    except FrozenAttributeError:
-        pass
-    else:
+    obj = factory(**factory_kwargs) if instance is None else instance
+    if set_field_value(obj, field_name, None):
         try:
             obj.validate()
         except TypeError: